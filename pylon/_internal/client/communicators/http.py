@@ -44,7 +44,8 @@ class AsyncHttpCommunicator(AbstractCommunicator[Request, Response]):
         return self._raw_client.build_request(
             method=HTTPMethod.PUT,
             url=Endpoint.SUBNET_WEIGHTS.for_version(request.version),
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers={"Content-Type": "application/json"},
         )
 
     @_translate_request.register
@@ -62,7 +63,8 @@ class AsyncHttpCommunicator(AbstractCommunicator[Request, Response]):
         )
 
     async def _translate_response(self, pylon_request: PylonRequest, response: Response) -> PylonResponse:
-        return pylon_request.response_cls(**response.json())
+        # Parse straight from the raw bytes with pydantic, without building intermediate python objects first.
+        return pylon_request.response_cls.model_validate_json(response.content)
 
     async def _request(self, request: Request) -> Response:
         assert self._raw_client and not self._raw_client.is_closed, (
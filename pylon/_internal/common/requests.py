@@ -39,11 +39,9 @@ class SetWeightsRequest(PylonRequest):
         if not v:
             raise ValueError("No weights provided")
 
-        for hotkey, weight in v.items():
-            if not hotkey or not isinstance(hotkey, str):
-                raise ValueError(f"Invalid hotkey: '{hotkey}' must be a non-empty string")
-            if not isinstance(weight, int | float):
-                raise ValueError(f"Invalid weight for hotkey '{hotkey}': '{weight}' must be a number")
+        # Types of hotkeys and weights are already enforced by the annotation, only empty hotkey is left to check.
+        if "" in v:
+            raise ValueError("Invalid hotkey: '' must be a non-empty string")
 
         return v
 
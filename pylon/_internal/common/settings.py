@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     bittensor_archive_network: BittensorNetwork = BittensorNetwork("archive")
     bittensor_archive_blocks_cutoff: ArchiveBlocksCutoff = ArchiveBlocksCutoff(300)
     bittensor_wallet_path: str
+    bittensor_neurons_cache_size: int = 16  # Number of (netuid, block) neurons kept in memory per client
+    bittensor_blocks_cache_size: int = 1024  # Number of blocks kept in memory per client
+    bittensor_certificates_cache_size: int = 16  # Number of (netuid, block) certificates kept in memory per client
 
     # Identities and access
     identities: list[IdentityName] = Field(default_factory=list)
@@ -1,5 +1,8 @@
 import asyncio
+import atexit
+import functools
 import logging
+from collections.abc import Iterator
 from types import TracebackType
 
 import docker
@@ -10,20 +13,45 @@ from pylon._internal.common.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_STARTUP_COMPLETE_LOG = b"Application startup complete."
+
+
+@functools.cache
+def _get_docker_client() -> docker.DockerClient:
+    """
+    Returns the docker client shared by all the managers, so that the connection and the API version negotiation
+    happen only once per process.
+    """
+    client = docker.from_env()
+    atexit.register(client.close)
+    return client
+
+
+def _container_environment() -> dict[str, str]:
+    """
+    Returns the environment passing the current settings to the service container.
+    """
+    return {f"PYLON_{key.upper()}": value for key, value in settings.model_dump().items()}
+
 
 class PylonDockerManager:
-    """An asynchronous context manager for starting and stopping the Pylon service in a Docker container."""
+    """
+    An asynchronous context manager for starting and stopping the Pylon service in a Docker container.
+
+    The container is started from `image_id` if given, e.g. a digest resolved once with
+    `docker_client.images.get(name).id` and reused across many managers; otherwise from the configured image name.
+    The container gets the settings as they are when the manager is created.
+    """
 
-    def __init__(self, port: int):
+    def __init__(self, port: int, image_id: str | None = None):
         self.port = port
+        self.image_id = image_id
+        self.environment = _container_environment()
         self.container: Container | None = None
-        self._docker_client = None
 
     @property
-    def docker_client(self):
-        if self._docker_client is None:
-            self._docker_client = docker.from_env()
-        return self._docker_client
+    def docker_client(self) -> docker.DockerClient:
+        return _get_docker_client()
 
     async def __aenter__(self):
         """Starts the pylon service in a docker container and waits for it to be ready."""
@@ -31,10 +59,10 @@ class PylonDockerManager:
         try:
             self.container = await asyncio.to_thread(
                 self.docker_client.containers.run,
-                settings.docker_image_name,
+                self.image_id or settings.docker_image_name,
                 detach=True,
                 ports={"8000/tcp": self.port},
-                environment={f"PYLON_{key.upper()}": value for key, value in settings.model_dump().items()},
+                environment=self.environment,
             )
             await self._wait_for_service()
             logger.info(f"Pylon container {self.container.short_id} started.")
@@ -57,31 +85,91 @@ class PylonDockerManager:
         if self.container:
             logger.info(f"Stopping pylon container {self.container.short_id}...")
             try:
-                await asyncio.to_thread(self.container.stop)
-                await asyncio.to_thread(self.container.remove)
+                await asyncio.to_thread(self._stop_and_remove, self.container)
                 logger.info("Pylon container stopped and removed.")
             except Exception as e:
                 logger.error(f"Failed to stop or remove container: {e}")
             finally:
                 self.container = None
 
-    async def _wait_for_service(self, retries: int = 10, delay: float = 1.0) -> None:
+    @staticmethod
+    def _stop_and_remove(container: Container) -> None:
+        """
+        Stops and removes the container in one go, so that both blocking calls share a single worker thread hop.
+        """
+        container.stop()
+        container.remove()
+
+    async def _wait_for_service(self, timeout: float = 30.0) -> None:
+        """
+        Waits for the Pylon service to be ready.
+
+        The service is ready as soon as uvicorn reports the app startup complete in the container logs, or as soon as
+        it responds to an HTTP probe, whichever comes first. The probe is a fallback for when the log line is missed.
+        If the container logs end before the service is ready (the container stopped), fails right away.
+
+        Raises:
+            RuntimeError: In case Pylon service fails to start, or does not start in time.
+        """
+        assert self.container is not None
+        logs = await asyncio.to_thread(self.container.logs, stream=True, follow=True)
+        # Each watcher returns once the service is ready, and raises if it finds out that the service cannot start.
+        watchers = [
+            asyncio.create_task(self._wait_for_startup_log(logs)),
+            asyncio.create_task(self._probe_service()),
+        ]
+        try:
+            async with asyncio.timeout(timeout):
+                done, _ = await asyncio.wait(watchers, return_when=asyncio.FIRST_COMPLETED)
+        except TimeoutError:
+            raise RuntimeError("Pylon service failed to start in time.")
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+            await asyncio.gather(*watchers, return_exceptions=True)
+            # Closing the stream ends the iteration in the log watcher thread. Some transports (e.g. SSH) cannot close
+            # the stream; the iteration then ends when the container stops.
+            try:
+                logs.close()
+            except Exception as e:
+                logger.debug(f"Failed to close the container logs stream: {e}")
+        if all(watcher.exception() is not None for watcher in done):
+            exc = next(iter(done)).exception()
+            raise RuntimeError(f"Pylon service failed to start: {exc}") from exc
+        logger.info("Pylon service is up.")
+
+    async def _wait_for_startup_log(self, logs: Iterator[bytes]) -> None:
         """
-        Waits for the Pylon service to be ready by polling the /health endpoint.
+        Waits until uvicorn reports that the app startup is complete in the container logs.
 
         Raises:
-            RuntimeError: In case Pylon service fails to start in time.
+            RuntimeError: When the logs end before the startup is complete.
+        """
+        if not await asyncio.to_thread(self._find_startup_log, logs):
+            raise RuntimeError("Pylon container stopped before the service was ready.")
+
+    @staticmethod
+    def _find_startup_log(logs: Iterator[bytes]) -> bool:
+        """
+        Follows the container logs until uvicorn reports that the app startup is complete. Runs in a worker thread.
+        Returns False if the logs end before that.
+        """
+        return any(_STARTUP_COMPLETE_LOG in chunk for chunk in logs)
+
+    async def _probe_service(self, initial_delay: float = 0.025, max_delay: float = 0.5) -> None:
+        """
+        Probes the service over HTTP until it responds. Uvicorn accepts connections only after the app startup
+        completes, so any HTTP response means the service is ready. The delay between probes grows exponentially from
+        `initial_delay` up to `max_delay`.
         """
-        await asyncio.sleep(delay)
+        delay = initial_delay
         async with httpx.AsyncClient() as client:
-            for i in range(retries):
+            while True:
                 try:
-                    response = await client.get(f"http://localhost:{self.port}/health")
-                    if response.status_code == 200:
-                        logger.info("Pylon service is up.")
-                        return
-                except Exception:
-                    pass
-                logger.error(f"Pylon service not ready yet (attempt {i + 1}/{retries})")
+                    await client.get(f"http://localhost:{self.port}/")
+                except httpx.TransportError:
+                    logger.debug(f"Pylon service not ready yet, retrying in {delay} seconds.")
+                else:
+                    return
                 await asyncio.sleep(delay)
-        raise RuntimeError("Pylon service failed to start in time.")
+                delay = min(delay * 2, max_delay)
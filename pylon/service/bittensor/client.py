@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from typing import Any, Generic, TypeVar
 
 from bittensor_wallet import Wallet
+from cachetools import LRUCache
 from turbobt.client import Bittensor
 from turbobt.neuron import Neuron as TurboBtNeuron
 from turbobt.subnet import (
@@ -68,6 +70,14 @@ from pylon._internal.common.types import (
 
 logger = logging.getLogger(__name__)
 
+# Blocks at least this deep below the latest block are cached by number. This is a heuristic, not finality (which
+# may stall): the depth is chosen conservatively, so that a hash of a cached block is very unlikely to change.
+CACHEABLE_BLOCK_DEPTH = 100
+
+# Main node can be considered to have pruned a block unknown to it only when the block is at least this deep below
+# the latest block. Shallower unknown blocks are rather caused by a lagging node or a reorg.
+MIN_PRUNED_BLOCK_DEPTH = 128
+
 
 class AbstractBittensorClient(ABC):
     """
@@ -210,7 +220,7 @@ class TurboBtClient(AbstractBittensorClient):
         return block
 
     @staticmethod
-    async def _translate_neuron(neuron: TurboBtNeuron, stakes: Stakes) -> Neuron:
+    def _translate_neuron(neuron: TurboBtNeuron, stakes: Stakes) -> Neuron:
         return Neuron(
             uid=NeuronUid(neuron.uid),
             coldkey=Coldkey(neuron.coldkey),
@@ -240,18 +250,20 @@ class TurboBtClient(AbstractBittensorClient):
             "The client is not open, please use the client as a context manager or call the open() method."
         )
         logger.debug(f"Fetching neurons from subnet {netuid} at block {block.number}, {self.uri}")
-        neurons = await self._raw_client.subnet(netuid).list_neurons(block_hash=block.hash)
-        # We need stakes fetched from subnet's state.
-        state = await self.get_subnet_state(netuid, block)
+        # We need stakes fetched from subnet's state. Both calls are independent, so they are made concurrently.
+        neurons, state = await asyncio.gather(
+            self._raw_client.subnet(netuid).list_neurons(block_hash=block.hash),
+            self.get_subnet_state(netuid, block),
+        )
         stakes = state.hotkeys_stakes
-        return [await self._translate_neuron(neuron, stakes[Hotkey(neuron.hotkey)]) for neuron in neurons]
+        return [self._translate_neuron(neuron, stakes[Hotkey(neuron.hotkey)]) for neuron in neurons]
 
     async def get_neurons(self, netuid: NetUid, block: Block) -> SubnetNeurons:
         neurons = await self.get_neurons_list(netuid, block)
         return SubnetNeurons(block=block, neurons={neuron.hotkey: neuron for neuron in neurons})
 
     @staticmethod
-    async def _translate_hyperparams(params: TurboBtSubnetHyperparams) -> SubnetHyperparams:
+    def _translate_hyperparams(params: TurboBtSubnetHyperparams) -> SubnetHyperparams:
         translated_params: dict[str, Any] = dict(params)
         if (commit_reveal := translated_params.get("commit_reveal_weights_enabled")) is not None:
             translated_params["commit_reveal_weights_enabled"] = (
@@ -267,10 +279,10 @@ class TurboBtClient(AbstractBittensorClient):
         params = await self._raw_client.subnet(netuid).get_hyperparameters(block_hash=block.hash)
         if not params:
             return None
-        return await self._translate_hyperparams(params)
+        return self._translate_hyperparams(params)
 
     @staticmethod
-    async def _translate_certificate(certificate: TurboBtNeuronCertificate) -> NeuronCertificate:
+    def _translate_certificate(certificate: TurboBtNeuronCertificate) -> NeuronCertificate:
         return NeuronCertificate(
             algorithm=CertificateAlgorithm(certificate["algorithm"]),
             public_key=PublicKey(certificate["public_key"]),
@@ -285,8 +297,7 @@ class TurboBtClient(AbstractBittensorClient):
         if not certificates:
             return {}
         return {
-            Hotkey(hotkey): await self._translate_certificate(certificate)
-            for hotkey, certificate in certificates.items()
+            Hotkey(hotkey): self._translate_certificate(certificate) for hotkey, certificate in certificates.items()
         }
 
     async def get_certificate(
@@ -304,11 +315,11 @@ class TurboBtClient(AbstractBittensorClient):
         )
         certificate = await self._raw_client.subnet(netuid).neuron(hotkey=hotkey).get_certificate(block_hash=block.hash)
         if certificate:
-            certificate = await self._translate_certificate(certificate)
+            certificate = self._translate_certificate(certificate)
         return certificate
 
     @staticmethod
-    async def _translate_certificate_keypair(keypair: TurboBtNeuronCertificateKeypair) -> NeuronCertificateKeypair:
+    def _translate_certificate_keypair(keypair: TurboBtNeuronCertificateKeypair) -> NeuronCertificateKeypair:
         return NeuronCertificateKeypair(
             algorithm=CertificateAlgorithm(keypair["algorithm"]),
             public_key=PublicKey(keypair["public_key"]),
@@ -326,7 +337,7 @@ class TurboBtClient(AbstractBittensorClient):
             algorithm=TurboBtCertificateAlgorithm(algorithm)
         )
         if keypair:
-            keypair = await self._translate_certificate_keypair(keypair)
+            keypair = self._translate_certificate_keypair(keypair)
         return keypair
 
     async def get_subnet_state(self, netuid: NetUid, block: Block) -> SubnetState:
@@ -341,18 +352,15 @@ class TurboBtClient(AbstractBittensorClient):
         assert self._raw_client is not None, (
             "The client is not open, please use the client as a context manager or call the open() method."
         )
-        translated_weights = {}
-        missing = []
         latest_block = await self.get_latest_block()
         # We don't use self.get_neurons to avoid unnecessary call for subnet state, translation etc.
         neurons = await self._raw_client.subnet(netuid).list_neurons(block_hash=latest_block.hash)
         hotkey_to_uid = {n.hotkey: n.uid for n in neurons}
-        for hotkey, weight in weights.items():
-            if hotkey in hotkey_to_uid:
-                translated_weights[hotkey_to_uid[hotkey]] = weight
-            else:
-                missing.append(hotkey)
-        if missing:
+        translated_weights = {
+            hotkey_to_uid[hotkey]: weight for hotkey, weight in weights.items() if hotkey in hotkey_to_uid
+        }
+        if len(translated_weights) < len(weights):
+            missing = [hotkey for hotkey in weights if hotkey not in hotkey_to_uid]
             logger.warning(
                 "Some of the hotkeys passed for weight commitment are missing. "
                 f"Weights will not be commited for the following hotkeys: {missing}."
@@ -387,6 +395,14 @@ class BittensorClient(Generic[SubClient], AbstractBittensorClient):
 
     This is a wrapper that delegates to two underlying
     client instances (main and archive) and handles fallback logic.
+
+    Neurons and certificates of a subnet never change for a given block, so the most recently fetched ones are kept in
+    LRU caches keyed by the block hash and served without asking the chain again. Concurrent requests for neurons that
+    are not cached yet share a single fetch. Cached instances are shared between requests, so callers must not
+    modify them.
+    Blocks fetched by number are cached as well once they are CACHEABLE_BLOCK_DEPTH blocks behind the latest block
+    seen, so resolving the hash of an older block does not need a round trip either. The depth is a heuristic rather
+    than finality, but a block this deep is not expected to be reorged.
     """
 
     def __init__(
@@ -396,27 +412,53 @@ class BittensorClient(Generic[SubClient], AbstractBittensorClient):
         archive_uri: BittensorNetwork,
         archive_blocks_cutoff: ArchiveBlocksCutoff = ArchiveBlocksCutoff(300),
         subclient_cls: type[SubClient] = TurboBtClient,
+        neurons_cache_size: int = 16,
+        blocks_cache_size: int = 1024,
+        certificates_cache_size: int = 16,
     ):
         super().__init__(wallet, uri)
         self.archive_uri = archive_uri
         self._archive_blocks_cutoff = archive_blocks_cutoff
         self.subclient_cls = subclient_cls
+        self._neurons_cache: LRUCache[tuple[NetUid, BlockHash], SubnetNeurons] = LRUCache(maxsize=neurons_cache_size)
+        self._neurons_fetches: dict[tuple[NetUid, BlockHash], asyncio.Task[SubnetNeurons]] = {}
+        self._blocks_cache: LRUCache[BlockNumber, Block] = LRUCache(maxsize=blocks_cache_size)
+        self._certificates_cache: LRUCache[tuple[NetUid, BlockHash], dict[Hotkey, NeuronCertificate]] = LRUCache(
+            maxsize=certificates_cache_size
+        )
+        self._latest_block_number = BlockNumber(0)
+        # Blocks below this one were found pruned by the main node, requests for them go straight to the archive.
+        self._main_oldest_block = BlockNumber(0)
         self._main_client: SubClient = self.subclient_cls(wallet, uri)
         self._archive_client: SubClient = self.subclient_cls(wallet, archive_uri)
 
     async def open(self) -> None:
-        await self._main_client.open()
-        await self._archive_client.open()
+        subclients = (self._main_client, self._archive_client)
+        results = await asyncio.gather(*(subclient.open() for subclient in subclients), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # Subclients open concurrently, so close the ones that did open before failing as a whole.
+            await asyncio.gather(
+                *(subclient.close() for subclient, result in zip(subclients, results) if result is None),
+                return_exceptions=True,
+            )
+            raise errors[0]
 
     async def close(self) -> None:
-        await self._main_client.close()
-        await self._archive_client.close()
+        await asyncio.gather(self._main_client.close(), self._archive_client.close())
 
     async def get_block(self, number: BlockNumber) -> Block | None:
-        return await self._delegate(self.subclient_cls.get_block, number=number)
+        if (block := self._blocks_cache.get(number)) is not None:
+            return block
+        block = await self._delegate(self.subclient_cls.get_block, number=number)
+        if block is not None and self._latest_block_number - block.number >= CACHEABLE_BLOCK_DEPTH:
+            self._blocks_cache[number] = block
+        return block
 
     async def get_latest_block(self) -> Block:
-        return await self._delegate(self.subclient_cls.get_latest_block)
+        block = await self._delegate(self.subclient_cls.get_latest_block)
+        self._latest_block_number = max(self._latest_block_number, block.number)
+        return block
 
     async def get_neurons_list(self, netuid: NetUid, block: Block) -> list[Neuron]:
         return await self._delegate(self.subclient_cls.get_neurons_list, netuid=netuid, block=block)
@@ -425,7 +467,13 @@ class BittensorClient(Generic[SubClient], AbstractBittensorClient):
         return await self._delegate(self.subclient_cls.get_hyperparams, netuid=netuid, block=block)
 
     async def get_certificates(self, netuid: NetUid, block: Block) -> dict[Hotkey, NeuronCertificate]:
-        return await self._delegate(self.subclient_cls.get_certificates, netuid=netuid, block=block)
+        cache_key = (netuid, block.hash)
+        if (certificates := self._certificates_cache.get(cache_key)) is not None:
+            logger.debug(f"Certificates of subnet {netuid} at block {block.number} served from cache.")
+            return certificates
+        certificates = await self._delegate(self.subclient_cls.get_certificates, netuid=netuid, block=block)
+        self._certificates_cache[cache_key] = certificates
+        return certificates
 
     async def get_certificate(
         self, netuid: NetUid, block: Block, hotkey: Hotkey | None = None
@@ -444,7 +492,20 @@ class BittensorClient(Generic[SubClient], AbstractBittensorClient):
         return await self._delegate(self.subclient_cls.set_weights, netuid=netuid, weights=weights)
 
     async def get_neurons(self, netuid: NetUid, block: Block) -> SubnetNeurons:
-        return await self._delegate(self.subclient_cls.get_neurons, netuid=netuid, block=block)
+        cache_key = (netuid, block.hash)
+        if (neurons := self._neurons_cache.get(cache_key)) is not None:
+            logger.debug(f"Neurons of subnet {netuid} at block {block.number} served from cache.")
+            return neurons
+        if (fetch := self._neurons_fetches.get(cache_key)) is None:
+            fetch = self._neurons_fetches[cache_key] = asyncio.create_task(self._fetch_neurons(netuid, block))
+            fetch.add_done_callback(lambda _: self._neurons_fetches.pop(cache_key, None))
+        # Shielded, so that a cancelled request does not cancel the fetch for other requests waiting for it.
+        return await asyncio.shield(fetch)
+
+    async def _fetch_neurons(self, netuid: NetUid, block: Block) -> SubnetNeurons:
+        neurons = await self._delegate(self.subclient_cls.get_neurons, netuid=netuid, block=block)
+        self._neurons_cache[(netuid, block.hash)] = neurons
+        return neurons
 
     async def get_subnet_state(self, netuid: NetUid, block: Block) -> SubnetState:
         return await self._delegate(self.subclient_cls.get_subnet_state, netuid=netuid, block=block)
@@ -456,19 +517,26 @@ class BittensorClient(Generic[SubClient], AbstractBittensorClient):
         Execute operation with a proper client.
 
         Operations that does not need a block are executed by the main client.
-        Archive client is used when the block is stale (older than archive_blocks_cutoff blocks).
+        Archive client is used when the block is stale (older than archive_blocks_cutoff blocks) or older than
+        a block the main client was already found not to know.
         Operations on the main client are retried if UnknownBlock exception is raised.
         """
         if block:
             kwargs["block"] = block
-            latest_block = await self._main_client.get_latest_block()
-            if latest_block.number - block.number > self._archive_blocks_cutoff:
+            latest_block = await self.get_latest_block()
+            if (
+                latest_block.number - block.number > self._archive_blocks_cutoff
+                or block.number < self._main_oldest_block
+            ):
                 logger.debug(f"Block is stale, falling back to the archive client: {self._archive_client.uri}")
                 return await operation(self._archive_client, *args, **kwargs)
 
         try:
             return await operation(self._main_client, *args, **kwargs)
         except UnknownBlock:
+            if block and latest_block.number - block.number >= MIN_PRUNED_BLOCK_DEPTH:
+                # The main node prunes old blocks, so it does not know any block older than this one either.
+                self._main_oldest_block = max(self._main_oldest_block, BlockNumber(block.number + 1))
             logger.warning(
                 f"Block unknown for the main client, falling back to the archive client: {self._archive_client.uri}"
             )
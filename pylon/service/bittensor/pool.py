@@ -1,12 +1,11 @@
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from contextlib import asynccontextmanager
 from enum import StrEnum
-from typing import Generic, Self, TypeVar
+from typing import Generic, NamedTuple, Self, TypeVar
 
 from bittensor_wallet import Wallet
-from pydantic import BaseModel, ConfigDict
 
 from pylon._internal.common.types import HotkeyName, WalletName
 from pylon.service.bittensor.client import AbstractBittensorClient, BittensorClient
@@ -18,7 +17,7 @@ class BittensorClientPoolInvalidState(Exception):
     pass
 
 
-class WalletKey(BaseModel):
+class WalletKey(NamedTuple):
     """
     Unique identifier for a wallet configuration.
     """
@@ -27,15 +26,9 @@ class WalletKey(BaseModel):
     hotkey_name: HotkeyName
     path: str
 
-    model_config = ConfigDict(frozen=True)
-
     @classmethod
     def from_wallet(cls, wallet: Wallet) -> Self:
-        return cls(
-            wallet_name=WalletName(wallet.name),
-            hotkey_name=HotkeyName(wallet.hotkey_str),
-            path=wallet.path,
-        )
+        return cls(WalletName(wallet.name), HotkeyName(wallet.hotkey_str), wallet.path)
 
 
 BTClient = TypeVar("BTClient", bound=AbstractBittensorClient)
@@ -52,6 +45,9 @@ class BittensorClientPool(Generic[BTClient]):
       - when the pool closes, first it waits for all the acquired clients to be released,
         then closes the clients gracefully.
     The pool may be re-opened after it is closed.
+    Clients for the wallets passed as `prewarm_wallets` are opened eagerly when the pool opens and make a request
+    right away. Connections and runtime metadata are loaded lazily on the first request, so this way the first API
+    requests do not pay for them.
     """
 
     class State(StrEnum):
@@ -60,13 +56,20 @@ class BittensorClientPool(Generic[BTClient]):
         CLOSED = "closed"
 
     def __init__(
-        self, client_cls: type[BTClient] = BittensorClient, pool_closing_timeout: float = 60, **client_kwargs
+        self,
+        client_cls: type[BTClient] = BittensorClient,
+        pool_closing_timeout: float = 60,
+        prewarm_wallets: Iterable[Wallet | None] = (),
+        prewarm_timeout: float = 10,
+        **client_kwargs,
     ) -> None:
         if "wallet" in client_kwargs:
             raise ValueError("Wallet may not be given as a client kwarg in the client pool.")
         self.state = self.State.CLOSED
         self.client_cls = client_cls
         self.closing_timeout = pool_closing_timeout
+        self.prewarm_wallets = list(prewarm_wallets)
+        self.prewarm_timeout = prewarm_timeout
         self._pool: dict[WalletKey | None, BTClient] = {}
         self._close_condition = asyncio.Condition()
         self._acquire_lock = asyncio.Lock()
@@ -83,8 +86,46 @@ class BittensorClientPool(Generic[BTClient]):
     async def open(self):
         self._verify_not_open()
         logger.info(f"Opening {self.client_cls.__name__} client pool.")
+        await self._prewarm()
         self.state = self.State.OPEN
 
+    async def _prewarm(self) -> None:
+        """
+        Open and warm up clients for the prewarm wallets concurrently. Failing clients are skipped, they will be
+        opened on the first acquire instead.
+        """
+        wallets = {wallet and WalletKey.from_wallet(wallet): wallet for wallet in self.prewarm_wallets}
+        if not wallets:
+            return
+        logger.info(f"Prewarming {len(wallets)} clients.")
+        clients = await asyncio.gather(
+            *(self._warm_up_client(wallet) for wallet in wallets.values()), return_exceptions=True
+        )
+        for wallet_key, client in zip(wallets, clients):
+            if isinstance(client, BaseException):
+                logger.error(f"Failed to prewarm the client for {wallet_key}.", exc_info=client)
+            else:
+                self._pool[wallet_key] = client
+
+    async def _warm_up_client(self, wallet: Wallet | None) -> BTClient:
+        """
+        Open a client and make a request with it, so that the connection is established and the runtime metadata is
+        loaded before the client is used. The client is closed if the request fails.
+        """
+        client = await self._open_client(wallet)
+        try:
+            async with asyncio.timeout(self.prewarm_timeout):
+                await client.get_latest_block()
+        except BaseException:
+            await client.close()
+            raise
+        return client
+
+    async def _open_client(self, wallet: Wallet | None) -> BTClient:
+        client = self.client_cls(wallet, **self.client_kwargs)
+        await client.open()
+        return client
+
     async def close(self):
         self._verify_open()
         logger.info(f"Closing sequence initialized for {self.client_cls.__name__} client pool.")
@@ -140,13 +181,16 @@ class BittensorClientPool(Generic[BTClient]):
             f"Acquiring client with {wallet_name} wallet from the pool. "
             f"Count of clients acquired: {self._acquire_counter}"
         )
-        async with self._acquire_lock:
-            if wallet_key in self._pool:
-                client = self._pool[wallet_key]
-            else:
-                logger.debug(f"New client open with {wallet_name} wallet.")
-                client = self._pool[wallet_key] = self.client_cls(wallet, **self.client_kwargs)
-                await client.open()
+        # Fast path: the client is already in the pool, no need to take the lock. Clients are put into the pool only
+        # after they are open, so the client from here is always ready to use.
+        client = self._pool.get(wallet_key)
+        if client is None:
+            async with self._acquire_lock:
+                # Another task might have created the client while this one was waiting for the lock.
+                client = self._pool.get(wallet_key)
+                if client is None:
+                    logger.debug(f"New client open with {wallet_name} wallet.")
+                    client = self._pool[wallet_key] = await self._open_client(wallet)
         try:
             yield client
         finally:
@@ -6,6 +6,8 @@ from litestar import Litestar
 
 from pylon._internal.common.settings import settings
 from pylon.service.bittensor.pool import BittensorClientPool
+from pylon.service.identities import identities
+from pylon.service.tasks import ApplyWeights
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +16,29 @@ logger = logging.getLogger(__name__)
 async def bittensor_client_pool(app: Litestar) -> AsyncGenerator[None, None]:
     """
     Lifespan for litestar app that creates an instance of BittensorClientPool so that endpoints may reuse
-    client instances.
+    client instances. Clients for the open access and for all the configured identities are connected upfront.
     """
     logger.debug("Initializing bittensor client pool.")
     async with BittensorClientPool(
         uri=settings.bittensor_network,
         archive_uri=settings.bittensor_archive_network,
         archive_blocks_cutoff=settings.bittensor_archive_blocks_cutoff,
+        neurons_cache_size=settings.bittensor_neurons_cache_size,
+        blocks_cache_size=settings.bittensor_blocks_cache_size,
+        certificates_cache_size=settings.bittensor_certificates_cache_size,
+        prewarm_wallets=[None, *(identity.wallet for identity in identities.values())],
     ) as pool:
         app.state.bittensor_client_pool = pool
         yield
+
+
+@asynccontextmanager
+async def background_tasks(app: Litestar) -> AsyncGenerator[None, None]:
+    """
+    Lifespan for litestar app that cancels background tasks still running on shutdown, so that they are not left
+    pending and do not use bittensor clients after the pool closes them.
+    """
+    try:
+        yield
+    finally:
+        await ApplyWeights.cancel_running()
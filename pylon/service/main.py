@@ -4,7 +4,8 @@ from litestar.openapi.config import OpenAPIConfig
 
 from pylon._internal.common.settings import settings
 from pylon.service import dependencies
-from pylon.service.lifespans import bittensor_client_pool
+from pylon.service.lifespans import background_tasks, bittensor_client_pool
+from pylon.service.responses import PydanticResponse
 from pylon.service.routers import v1_router
 from pylon.service.schema import PylonSchemaPlugin
 from pylon.service.sentry_config import init_sentry
@@ -21,9 +22,11 @@ def create_app() -> Litestar:
             version="0.1.0",
             description="REST API for the bittensor-pylon service",
         ),
-        lifespan=[bittensor_client_pool],
+        # Lifespans exit in reverse order: background tasks are cancelled before the client pool closes.
+        lifespan=[bittensor_client_pool, background_tasks],
         dependencies={"bt_client_pool": Provide(dependencies.bt_client_pool_dep, use_cache=True)},
         plugins=[PylonSchemaPlugin()],
+        response_class=PydanticResponse,
         debug=settings.debug,
     )
 
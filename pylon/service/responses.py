@@ -0,0 +1,42 @@
+from typing import Any, ClassVar
+
+from cachetools import LRUCache
+from litestar import Response
+from litestar.enums import MediaType
+from litestar.serialization import default_serializer
+from litestar.types import Serializer
+from pydantic import BaseModel
+
+from pylon._internal.common.models import SubnetNeurons
+
+# Recently rendered models, keyed by the identity of the model. The model itself is kept in the entry, so that its id
+# cannot be reused by another object while the entry is cached.
+_rendered_models: LRUCache[tuple[int, str], tuple[BaseModel, bytes]] = LRUCache(maxsize=16)
+
+
+class PydanticResponse(Response):
+    """
+    Response that serializes pydantic models with pydantic's own (Rust) JSON serializer.
+
+    The default path first dumps the model into python objects and then encodes them with msgspec, which is slow
+    for large payloads like the subnet neurons. Any other content is rendered the default way.
+
+    Instances of `reusable_types` are served from the shared caches of the bittensor client and are never modified
+    by the service, so the rendered JSON of the recently rendered ones is reused. The same cached instance served
+    again (e.g. the neurons of a block) is then not serialized again.
+    """
+
+    reusable_types: ClassVar[tuple[type[BaseModel], ...]] = (SubnetNeurons,)
+
+    def render(self, content: Any, media_type: str, enc_hook: Serializer = default_serializer) -> bytes:
+        if isinstance(content, BaseModel) and media_type == MediaType.JSON:
+            if not isinstance(content, self.reusable_types):
+                return content.model_dump_json().encode(self.encoding)
+            cache_key = (id(content), self.encoding)
+            cached = _rendered_models.get(cache_key)
+            if cached is not None and cached[0] is content:
+                return cached[1]
+            rendered = content.model_dump_json().encode(self.encoding)
+            _rendered_models[cache_key] = (content, rendered)
+            return rendered
+        return super().render(content, media_type, enc_hook)
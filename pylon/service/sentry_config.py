@@ -1,7 +1,3 @@
-import sentry_sdk
-from sentry_sdk.integrations.asyncio import AsyncioIntegration
-from sentry_sdk.integrations.litestar import LitestarIntegration
-
 from pylon._internal.common.settings import settings
 
 
@@ -10,6 +6,11 @@ def init_sentry() -> None:
     if not settings.sentry_dsn:
         return
 
+    # Imported here so that sentry is not loaded at all when it is disabled.
+    import sentry_sdk
+    from sentry_sdk.integrations.asyncio import AsyncioIntegration
+    from sentry_sdk.integrations.litestar import LitestarIntegration
+
     sentry_sdk.init(
         dsn=settings.sentry_dsn,
         environment=settings.sentry_environment,
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 class ApplyWeights:
     JOB_NAME: ClassVar[str] = "apply_weights"
     tasks_running = set()
+    # Attempts to apply weights are shielded from the job timeout, so they are tracked separately to be awaited on
+    # shutdown even after their job is cancelled.
+    attempts_running: ClassVar[set[asyncio.Task[None]]] = set()
 
     def __init__(self, client: AbstractBittensorClient):
         self._client: AbstractBittensorClient = client
@@ -26,6 +29,30 @@ class ApplyWeights:
         task.add_done_callback(apply_weights._log_done)
         return apply_weights
 
+    @classmethod
+    async def cancel_running(cls, attempts_timeout: float = 30) -> None:
+        """
+        Cancels all the running tasks and waits until they are finished.
+
+        Attempts to apply weights that are already in progress are given `attempts_timeout` seconds to finish,
+        so that the weights being submitted are not interrupted half way; the ones still running after that are
+        cancelled.
+        """
+        tasks = list(cls.tasks_running)
+        if tasks:
+            logger.info(f"Cancelling {len(tasks)} running {cls.JOB_NAME} tasks.")
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        attempts = list(cls.attempts_running)
+        if attempts:
+            logger.info(f"Waiting up to {attempts_timeout} seconds for {len(attempts)} {cls.JOB_NAME} attempts.")
+            _, pending = await asyncio.wait(attempts, timeout=attempts_timeout)
+            for attempt in pending:
+                logger.warning(f"Cancelling {cls.JOB_NAME} attempt that did not finish in time: {attempt}")
+                attempt.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+
     async def run_job(self, weights: dict[Hotkey, Weight], netuid: NetUid) -> None:
         start_block = await self._client.get_latest_block()
 
@@ -48,7 +75,9 @@ class ApplyWeights:
                 f"still got {initial_tempo.end - latest_block.number} blocks left to go."
             )
             try:
-                apply_weights = self._apply_weights(weights, netuid, latest_block)
+                apply_weights = asyncio.create_task(self._apply_weights(weights, netuid, latest_block))
+                self.attempts_running.add(apply_weights)
+                apply_weights.add_done_callback(self.attempts_running.discard)
                 await asyncio.wait_for(asyncio.shield(apply_weights), 120)
                 return
             except Exception as exc:
@@ -78,6 +107,9 @@ class ApplyWeights:
     def _log_done(self, job: asyncio.Task[None]) -> None:
         logger.info(f"Task finished {job}")
         self.tasks_running.discard(job)
+        if job.cancelled():
+            logger.warning(f"Weights job cancelled: {job}")
+            return
         try:
             job.result()
         except Exception as exc:  # noqa: BLE001
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from pylon._internal.client.abstract import AbstractAsyncPylonClient
 from pylon._internal.client.asynchronous import AsyncPylonClient
 from pylon._internal.client.config import AsyncPylonClientConfig, DEFAULT_RETRIES
@@ -44,4 +46,19 @@ from pylon._internal.common.types import (
     NeuronActive,
     ValidatorPermit,
 )
-from pylon._internal.docker_manager import PylonDockerManager
+
+if TYPE_CHECKING:
+    from pylon._internal.docker_manager import PylonDockerManager
+
+
+def __getattr__(name: str):
+    # PylonDockerManager pulls in docker and the service settings, so it is imported only when it is used.
+    if name == "PylonDockerManager":
+        from pylon._internal.docker_manager import PylonDockerManager
+
+        return PylonDockerManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return [*globals(), "PylonDockerManager"]
@@ -0,0 +1,167 @@
+"""
+Tests for the readiness check of PylonDockerManager.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+from docker.errors import DockerException
+
+from pylon._internal.common.settings import settings
+from pylon._internal.docker_manager import PylonDockerManager
+
+
+class FakeLogStream:
+    """
+    Blocking log stream like the one returned by docker; after the lines are exhausted, it either ends or follows
+    the logs until it is closed.
+    """
+
+    def __init__(self, lines: list[bytes], follow: bool):
+        self.lines = lines
+        self.follow = follow
+        self.closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.lines
+        if self.follow:
+            self.closed.wait()
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+class UnclosableLogStream(FakeLogStream):
+    """
+    Log stream that cannot be closed, like the one returned by docker over SSH.
+    """
+
+    def close(self) -> None:
+        raise DockerException("Cancellable streams not supported for the SSH protocol")
+
+
+class FakeContainer:
+    def __init__(self, logs: FakeLogStream):
+        self._logs = logs
+
+    def logs(self, stream: bool, follow: bool) -> FakeLogStream:
+        return self._logs
+
+
+async def probe_never_ready() -> None:
+    await asyncio.Event().wait()
+
+
+async def probe_ready() -> None:
+    pass
+
+
+async def probe_broken() -> None:
+    raise ValueError("Unexpected probe error")
+
+
+def create_manager(logs: FakeLogStream, probe) -> PylonDockerManager:
+    manager = PylonDockerManager(port=8000)
+    manager.container = FakeContainer(logs)  # type: ignore[assignment]
+    manager._probe_service = probe  # type: ignore[method-assign]
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_ready_from_logs():
+    """
+    Test that the service is ready when the startup complete line appears in the logs, and the logs are closed.
+    """
+    logs = FakeLogStream([b"INFO: Waiting for application startup.\n", b"INFO: Application startup complete.\n"], True)
+    manager = create_manager(logs, probe_never_ready)
+
+    await manager._wait_for_service(timeout=1)
+
+    assert logs.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_ready_from_probe():
+    """
+    Test that the service is ready when the probe succeeds before the line appears in the logs.
+    """
+    logs = FakeLogStream([b"INFO: Waiting for application startup.\n"], True)
+    manager = create_manager(logs, probe_ready)
+
+    await manager._wait_for_service(timeout=1)
+
+    assert logs.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_logs_end_before_ready():
+    """
+    Test that the wait fails right away when the logs end before the service is ready (the container stopped).
+    """
+    logs = FakeLogStream([b"ERROR: Application startup failed. Exiting.\n"], False)
+    manager = create_manager(logs, probe_never_ready)
+
+    with pytest.raises(RuntimeError, match="Pylon container stopped before the service was ready."):
+        await manager._wait_for_service(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_probe_error():
+    """
+    Test that an unexpected probe error fails the wait instead of being swallowed.
+    """
+    logs = FakeLogStream([], True)
+    manager = create_manager(logs, probe_broken)
+
+    with pytest.raises(RuntimeError, match="Unexpected probe error"):
+        await manager._wait_for_service(timeout=10)
+
+    assert logs.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_timeout():
+    """
+    Test that the wait fails when the service is not ready in time.
+    """
+    logs = FakeLogStream([], True)
+    manager = create_manager(logs, probe_never_ready)
+
+    with pytest.raises(RuntimeError, match="Pylon service failed to start in time."):
+        await manager._wait_for_service(timeout=0.1)
+
+    assert logs.closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_service_logs_cannot_be_closed():
+    """
+    Test that the service is ready even when the logs stream cannot be closed, and the probe does not keep running.
+    """
+    logs = UnclosableLogStream([b"INFO: Application startup complete.\n"], True)
+    probes: list[asyncio.Task] = []
+
+    async def probe_tracked() -> None:
+        probes.append(asyncio.current_task())  # type: ignore[arg-type]
+        await probe_never_ready()
+
+    manager = create_manager(logs, probe_tracked)
+
+    await manager._wait_for_service(timeout=1)
+
+    assert len(probes) == 1
+    assert probes[0].done()
+
+
+def test_manager_environment_follows_settings(monkeypatch):
+    """
+    Test that each manager passes the settings as they are when it is created to the container.
+    """
+    manager = PylonDockerManager(port=8000)
+    monkeypatch.setattr(settings, "docker_image_name", "pylon:modified")
+    modified_manager = PylonDockerManager(port=8000)
+
+    assert manager.environment["PYLON_DOCKER_IMAGE_NAME"] != "pylon:modified"
+    assert modified_manager.environment["PYLON_DOCKER_IMAGE_NAME"] == "pylon:modified"
@@ -0,0 +1,27 @@
+"""
+Tests for the public pylon.v1 module.
+"""
+
+import subprocess
+import sys
+
+import pylon.v1
+
+
+def test_v1_import_does_not_load_docker():
+    """
+    Test that importing pylon.v1 does not import docker nor the docker manager, which are loaded only when used.
+    """
+    code = "import sys, pylon.v1; print('docker' in sys.modules, 'pylon._internal.docker_manager' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_v1_dir_lists_docker_manager():
+    """
+    Test that the lazily imported PylonDockerManager is listed in the module attributes.
+    """
+    assert "PylonDockerManager" in dir(pylon.v1)
+    assert "AsyncPylonClient" in dir(pylon.v1)
@@ -0,0 +1,84 @@
+import ipaddress
+
+import pytest
+from bittensor_wallet import Wallet
+
+from pylon._internal.common.currency import Currency, Token
+from pylon._internal.common.models import AxonInfo, AxonProtocol, Neuron, Stakes
+from pylon._internal.common.types import (
+    AlphaStake,
+    ArchiveBlocksCutoff,
+    BittensorNetwork,
+    Coldkey,
+    Consensus,
+    Dividends,
+    Emission,
+    Hotkey,
+    Incentive,
+    NeuronActive,
+    NeuronUid,
+    Port,
+    PruningScore,
+    Rank,
+    Stake,
+    TaoStake,
+    Timestamp,
+    TotalStake,
+    Trust,
+    ValidatorPermit,
+    ValidatorTrust,
+)
+from pylon.service.bittensor.client import BittensorClient
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+@pytest.fixture
+def test_neuron():
+    return Neuron(
+        uid=NeuronUid(1),
+        coldkey=Coldkey("coldkey_1"),
+        hotkey=Hotkey("test_hotkey"),
+        active=NeuronActive(True),
+        axon_info=AxonInfo(ip=ipaddress.IPv4Address("192.168.1.1"), port=Port(8080), protocol=AxonProtocol.TCP),
+        stake=Stake(100.0),
+        rank=Rank(0.5),
+        emission=Emission(Currency[Token.ALPHA](10.0)),
+        incentive=Incentive(0.8),
+        consensus=Consensus(0.9),
+        trust=Trust(0.7),
+        validator_trust=ValidatorTrust(0.6),
+        dividends=Dividends(0.4),
+        last_update=Timestamp(1000),
+        validator_permit=ValidatorPermit(True),
+        pruning_score=PruningScore(50),
+        stakes=Stakes(
+            alpha=AlphaStake(Currency[Token.ALPHA](75.0)),
+            tao=TaoStake(Currency[Token.TAO](25.0)),
+            total=TotalStake(Currency[Token.ALPHA](100.0)),
+        ),
+    )
+
+
+@pytest.fixture
+def bittensor_client():
+    wallet = Wallet()
+
+    # Create BittensorClient
+    client = BittensorClient(
+        wallet=wallet,
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
+        subclient_cls=MockBittensorClient,
+    )
+    return client
+
+
+@pytest.fixture
+def main_client(bittensor_client):
+    return bittensor_client._main_client
+
+
+@pytest.fixture
+def archive_client(bittensor_client):
+    return bittensor_client._archive_client
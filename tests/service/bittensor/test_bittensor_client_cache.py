@@ -0,0 +1,116 @@
+"""
+Tests for BittensorClient caches.
+
+These tests verify that the neurons, blocks and certificates are served from the caches of BittensorClient
+instead of being fetched again.
+"""
+
+import asyncio
+
+import pytest
+
+from pylon._internal.common.models import Block, CertificateAlgorithm, NeuronCertificate, SubnetNeurons
+from pylon._internal.common.types import BlockHash, BlockNumber, Hotkey, NetUid, PublicKey
+
+
+@pytest.mark.asyncio
+async def test_get_neurons_cached_per_block(bittensor_client, main_client, archive_client, test_neuron):
+    """
+    Test that neurons are fetched once per block and served from the cache afterwards.
+    """
+    block = Block(number=BlockNumber(450), hash=BlockHash("0xrecent"))
+    other_block = Block(number=BlockNumber(451), hash=BlockHash("0xother"))
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    neurons = SubnetNeurons(block=block, neurons={test_neuron.hotkey: test_neuron})
+    other_neurons = SubnetNeurons(block=other_block, neurons={test_neuron.hotkey: test_neuron})
+
+    async with bittensor_client:
+        async with main_client.mock_behavior(
+            get_latest_block=[latest_block, latest_block],
+            get_neurons=[neurons, other_neurons],
+        ):
+            first_result = await bittensor_client.get_neurons(netuid=NetUid(1), block=block)
+            second_result = await bittensor_client.get_neurons(netuid=NetUid(1), block=block)
+            other_result = await bittensor_client.get_neurons(netuid=NetUid(1), block=other_block)
+
+    assert first_result == second_result == neurons
+    assert other_result == other_neurons
+    assert main_client.calls["get_neurons"] == [(1, block), (1, other_block)]
+    assert archive_client.calls["get_neurons"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_neurons_concurrent_requests_share_fetch(bittensor_client, main_client, archive_client, test_neuron):
+    """
+    Test that concurrent requests for neurons not cached yet are served by a single fetch.
+    """
+    block = Block(number=BlockNumber(450), hash=BlockHash("0xrecent"))
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    neurons = SubnetNeurons(block=block, neurons={test_neuron.hotkey: test_neuron})
+
+    async with bittensor_client:
+        async with main_client.mock_behavior(
+            get_latest_block=[latest_block],
+            get_neurons=[neurons],
+        ):
+            results = await asyncio.gather(
+                *(bittensor_client.get_neurons(netuid=NetUid(1), block=block) for _ in range(3))
+            )
+
+    assert results == [neurons, neurons, neurons]
+    assert main_client.calls["get_neurons"] == [(1, block)]
+    assert archive_client.calls["get_neurons"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_block_cached_when_deep_enough(bittensor_client, main_client):
+    """
+    Test that blocks deep enough below the latest block are cached, and the recent ones are fetched every time.
+    """
+    latest_block = Block(number=BlockNumber(600), hash=BlockHash("0xlatest"))
+    old_block = Block(number=BlockNumber(450), hash=BlockHash("0xold"))
+    recent_block = Block(number=BlockNumber(595), hash=BlockHash("0xrecent"))
+
+    async with bittensor_client:
+        async with main_client.mock_behavior(
+            get_latest_block=[latest_block],
+            get_block=[old_block, recent_block, recent_block],
+        ):
+            await bittensor_client.get_latest_block()
+            results = [
+                await bittensor_client.get_block(BlockNumber(450)),
+                await bittensor_client.get_block(BlockNumber(450)),
+                await bittensor_client.get_block(BlockNumber(595)),
+                await bittensor_client.get_block(BlockNumber(595)),
+            ]
+
+    assert results == [old_block, old_block, recent_block, recent_block]
+    assert main_client.calls["get_block"] == [(450,), (595,), (595,)]
+
+
+@pytest.mark.asyncio
+async def test_get_certificates_cached_per_block(bittensor_client, main_client, archive_client):
+    """
+    Test that certificates are fetched once per block and served from the cache afterwards.
+    """
+    block = Block(number=BlockNumber(450), hash=BlockHash("0xrecent"))
+    other_block = Block(number=BlockNumber(451), hash=BlockHash("0xother"))
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    certificates = {
+        Hotkey("test_hotkey"): NeuronCertificate(algorithm=CertificateAlgorithm.ED25519, public_key=PublicKey("0xkey"))
+    }
+    other_certificates = {}
+
+    async with bittensor_client:
+        async with main_client.mock_behavior(
+            get_latest_block=[latest_block, latest_block],
+            get_certificates=[certificates, other_certificates],
+        ):
+            first_result = await bittensor_client.get_certificates(netuid=NetUid(1), block=block)
+            second_result = await bittensor_client.get_certificates(netuid=NetUid(1), block=block)
+            other_result = await bittensor_client.get_certificates(netuid=NetUid(1), block=other_block)
+
+    assert first_result == second_result == certificates
+    assert other_result == other_certificates
+    assert main_client.calls["get_certificates"] == [(1, block), (1, other_block)]
+    assert archive_client.calls["get_certificates"] == []
@@ -5,94 +5,11 @@ These tests verify the delegation logic in BittensorClient._delegate() that dete
 the main client or the archive client based on block age and availability.
 """
 
-import ipaddress
-
 import pytest
-from bittensor_wallet import Wallet
 from turbobt.substrate.exceptions import UnknownBlock
 
-from pylon._internal.common.currency import Currency, Token
-from pylon._internal.common.models import AxonInfo, AxonProtocol, Block, Neuron, Stakes
-from pylon._internal.common.types import (
-    AlphaStake,
-    ArchiveBlocksCutoff,
-    BittensorNetwork,
-    BlockHash,
-    BlockNumber,
-    Coldkey,
-    Consensus,
-    Dividends,
-    Emission,
-    Hotkey,
-    Incentive,
-    NetUid,
-    NeuronActive,
-    NeuronUid,
-    Port,
-    PruningScore,
-    Rank,
-    Stake,
-    TaoStake,
-    Timestamp,
-    TotalStake,
-    Trust,
-    ValidatorPermit,
-    ValidatorTrust,
-)
-from pylon.service.bittensor.client import BittensorClient
-from tests.mock_bittensor_client import MockBittensorClient
-
-
-@pytest.fixture
-def test_neuron():
-    return Neuron(
-        uid=NeuronUid(1),
-        coldkey=Coldkey("coldkey_1"),
-        hotkey=Hotkey("test_hotkey"),
-        active=NeuronActive(True),
-        axon_info=AxonInfo(ip=ipaddress.IPv4Address("192.168.1.1"), port=Port(8080), protocol=AxonProtocol.TCP),
-        stake=Stake(100.0),
-        rank=Rank(0.5),
-        emission=Emission(Currency[Token.ALPHA](10.0)),
-        incentive=Incentive(0.8),
-        consensus=Consensus(0.9),
-        trust=Trust(0.7),
-        validator_trust=ValidatorTrust(0.6),
-        dividends=Dividends(0.4),
-        last_update=Timestamp(1000),
-        validator_permit=ValidatorPermit(True),
-        pruning_score=PruningScore(50),
-        stakes=Stakes(
-            alpha=AlphaStake(Currency[Token.ALPHA](75.0)),
-            tao=TaoStake(Currency[Token.TAO](25.0)),
-            total=TotalStake(Currency[Token.ALPHA](100.0)),
-        ),
-    )
-
-
-@pytest.fixture
-def bittensor_client():
-    wallet = Wallet()
-
-    # Create BittensorClient
-    client = BittensorClient(
-        wallet=wallet,
-        uri=BittensorNetwork("ws://main"),
-        archive_uri=BittensorNetwork("ws://archive"),
-        archive_blocks_cutoff=ArchiveBlocksCutoff(300),
-        subclient_cls=MockBittensorClient,
-    )
-    return client
-
-
-@pytest.fixture
-def main_client(bittensor_client):
-    return bittensor_client._main_client
-
-
-@pytest.fixture
-def archive_client(bittensor_client):
-    return bittensor_client._archive_client
+from pylon._internal.common.models import Block
+from pylon._internal.common.types import ArchiveBlocksCutoff, BlockHash, BlockNumber, NetUid
 
 
 @pytest.mark.asyncio
@@ -146,6 +63,68 @@ async def test_delegation_unknown_block_falls_back_to_archive(
     assert archive_client.calls["get_neurons_list"] == [(1, recent_block)]
 
 
+@pytest.mark.asyncio
+async def test_delegation_older_than_unknown_block_uses_archive_client(
+    bittensor_client, main_client, archive_client, test_neuron
+):
+    """
+    Test that blocks older than a block unknown to the main client, deep enough to be pruned, go straight to the
+    archive client.
+    """
+    unknown_block = Block(number=BlockNumber(450), hash=BlockHash("0xunknown"))
+    older_block = Block(number=BlockNumber(440), hash=BlockHash("0xolder"))
+    newer_block = Block(number=BlockNumber(460), hash=BlockHash("0xnewer"))
+    latest_block = Block(number=BlockNumber(700), hash=BlockHash("0xlatest"))
+    expected_neurons = [test_neuron]
+
+    async with bittensor_client:
+        async with (
+            main_client.mock_behavior(
+                get_latest_block=[latest_block, latest_block, latest_block],
+                get_neurons_list=[UnknownBlock(), expected_neurons],
+            ),
+            archive_client.mock_behavior(
+                get_neurons_list=[expected_neurons, expected_neurons],
+            ),
+        ):
+            await bittensor_client.get_neurons_list(netuid=NetUid(1), block=unknown_block)
+            await bittensor_client.get_neurons_list(netuid=NetUid(1), block=older_block)
+            await bittensor_client.get_neurons_list(netuid=NetUid(1), block=newer_block)
+
+    assert main_client.calls["get_neurons_list"] == [(1, unknown_block), (1, newer_block)]
+    assert archive_client.calls["get_neurons_list"] == [(1, unknown_block), (1, older_block)]
+
+
+@pytest.mark.asyncio
+async def test_delegation_recent_unknown_block_does_not_route_older_blocks_to_archive(
+    bittensor_client, main_client, archive_client, test_neuron
+):
+    """
+    Test that a recent block unknown to the main client (e.g. lagging node) does not send older blocks to
+    the archive client.
+    """
+    unknown_block = Block(number=BlockNumber(495), hash=BlockHash("0xunknown"))
+    older_block = Block(number=BlockNumber(490), hash=BlockHash("0xolder"))
+    latest_block = Block(number=BlockNumber(500), hash=BlockHash("0xlatest"))
+    expected_neurons = [test_neuron]
+
+    async with bittensor_client:
+        async with (
+            main_client.mock_behavior(
+                get_latest_block=[latest_block, latest_block],
+                get_neurons_list=[UnknownBlock(), expected_neurons],
+            ),
+            archive_client.mock_behavior(
+                get_neurons_list=[expected_neurons],
+            ),
+        ):
+            await bittensor_client.get_neurons_list(netuid=NetUid(1), block=unknown_block)
+            await bittensor_client.get_neurons_list(netuid=NetUid(1), block=older_block)
+
+    assert main_client.calls["get_neurons_list"] == [(1, unknown_block), (1, older_block)]
+    assert archive_client.calls["get_neurons_list"] == [(1, unknown_block)]
+
+
 @pytest.mark.asyncio
 async def test_delegation_exact_cutoff_boundary_uses_main_client(
     bittensor_client, main_client, archive_client, test_neuron
@@ -0,0 +1,41 @@
+"""
+Tests for BittensorClient lifecycle.
+
+These tests verify how BittensorClient opens and closes its main and archive subclients.
+"""
+
+import pytest
+from bittensor_wallet import Wallet
+
+from pylon._internal.common.types import BittensorNetwork
+from pylon.service.bittensor.client import BittensorClient
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+class ArchiveUnavailableMockBittensorClient(MockBittensorClient):
+    was_opened = False
+
+    async def open(self) -> None:
+        if self.uri == "ws://archive":
+            raise ConnectionError("Archive node unavailable")
+        await super().open()
+        self.was_opened = True
+
+
+@pytest.mark.asyncio
+async def test_open_failure_closes_opened_subclients():
+    """
+    Test that when one subclient fails to open, the subclients that did open are closed and the error is raised.
+    """
+    bittensor_client = BittensorClient(
+        wallet=Wallet(),
+        uri=BittensorNetwork("ws://main"),
+        archive_uri=BittensorNetwork("ws://archive"),
+        subclient_cls=ArchiveUnavailableMockBittensorClient,
+    )
+
+    with pytest.raises(ConnectionError, match="Archive node unavailable"):
+        await bittensor_client.open()
+
+    assert bittensor_client._main_client.was_opened is True
+    assert bittensor_client._main_client._is_open is False
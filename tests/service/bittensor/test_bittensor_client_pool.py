@@ -4,7 +4,8 @@ import pytest
 import pytest_asyncio
 from bittensor_wallet import Wallet
 
-from pylon._internal.common.types import HotkeyName, WalletName
+from pylon._internal.common.models import Block
+from pylon._internal.common.types import BlockHash, BlockNumber, HotkeyName, WalletName
 from pylon.service.bittensor.client import BittensorClient
 from pylon.service.bittensor.pool import (
     BittensorClientPool,
@@ -12,6 +13,7 @@ from pylon.service.bittensor.pool import (
     WalletKey,
 )
 from tests.helpers import wait_until
+from tests.mock_bittensor_client import MockBittensorClient
 
 
 @pytest_asyncio.fixture
@@ -66,7 +68,7 @@ async def test_bittensor_client_pool_proper_use(barrier_factory):
     # Acquire the client and check its attributes.
     async with pool.acquire(wallet=wallets[0]) as client_wallet:
         assert pool._pool == {
-            WalletKey(  # type: ignore[reportUnhashable]
+            WalletKey(
                 wallet_name=WalletName("default"), hotkey_name=HotkeyName("default"), path="~/.bittensor/wallets/"
             ): client_wallet
         }
@@ -80,7 +82,7 @@ async def test_bittensor_client_pool_proper_use(barrier_factory):
     # Check if you can acquire client without wallet
     async with pool.acquire(wallet=None) as client_no_wallet:
         assert pool._pool == {
-            WalletKey(  # type: ignore[reportUnhashable]
+            WalletKey(
                 wallet_name=WalletName("default"), hotkey_name=HotkeyName("default"), path="~/.bittensor/wallets/"
             ): client_wallet,
             None: client_no_wallet,
@@ -236,3 +238,61 @@ async def test_bittensor_client_pool_close_timeout(barrier_factory):
     client = task.result()
     assert client._main_client._raw_client is None
     assert client._archive_client._raw_client is None
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_acquire_existing_client_without_lock():
+    """
+    Test that acquiring a client that is already in the pool does not wait for the acquire lock.
+    """
+    pool = BittensorClientPool(
+        uri="ws://localhost:8000",
+        archive_uri="ws://localhost:8001",
+    )
+    await pool.open()
+    async with pool.acquire(wallet=None) as client:
+        pass
+    async with pool._acquire_lock:
+        async with asyncio.timeout(2):
+            async with pool.acquire(wallet=None) as same_client:
+                assert same_client is client
+    await pool.close()
+
+
+class PrewarmMockBittensorClient(MockBittensorClient):
+    """
+    Mock client that answers the prewarm request, except for the clients with the "broken" wallet.
+    """
+
+    instances: list["PrewarmMockBittensorClient"] = []
+
+    def __init__(self, wallet: Wallet | None = None, **kwargs):
+        super().__init__(wallet, **kwargs)
+        self.instances.append(self)
+        if self.wallet.name == "broken":
+            self._behaviors["get_latest_block"].append(RuntimeError("Connection refused"))
+        else:
+            self._behaviors["get_latest_block"].append(Block(number=BlockNumber(100), hash=BlockHash("0x100")))
+
+
+@pytest.mark.asyncio
+async def test_bittensor_client_pool_prewarm():
+    """
+    Test that clients for the prewarm wallets make a request when the pool opens and are reused on acquire,
+    and that clients failing the request are closed and skipped.
+    """
+    PrewarmMockBittensorClient.instances.clear()
+    wallet = Wallet()
+    broken_wallet = Wallet(name="broken")
+    pool = BittensorClientPool(client_cls=PrewarmMockBittensorClient, prewarm_wallets=[None, wallet, broken_wallet])
+    await pool.open()
+    wallet_key = WalletKey.from_wallet(wallet)
+    assert set(pool._pool) == {None, wallet_key}
+    assert [client.calls["get_latest_block"] for client in pool._pool.values()] == [[()], [()]]
+    broken_client = next(client for client in PrewarmMockBittensorClient.instances if client.wallet.name == "broken")
+    assert broken_client.calls["get_latest_block"] == [()]
+    assert broken_client._is_open is False
+    async with pool.acquire(wallet=wallet) as client:
+        assert client is pool._pool[wallet_key]
+    await pool.close()
+    assert pool._pool == {}
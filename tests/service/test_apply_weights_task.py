@@ -0,0 +1,98 @@
+"""
+Tests for the ApplyWeights background task.
+"""
+
+import asyncio
+
+import pytest
+
+from pylon._internal.common.models import Block, CommitReveal, SubnetHyperparams
+from pylon._internal.common.types import BlockHash, BlockNumber, Hotkey, NetUid, RevealRound, Weight
+from pylon.service.tasks import ApplyWeights
+from tests.helpers import wait_until
+from tests.mock_bittensor_client import MockBittensorClient
+
+
+@pytest.mark.asyncio
+async def test_apply_weights_cancel_running():
+    """
+    Test that cancel_running cancels a task waiting between retries and waits for it to finish.
+    """
+    client = MockBittensorClient()
+    block = Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+    async with client.mock_behavior(
+        get_latest_block=[block, block],
+        get_hyperparams=[RuntimeError("Failed to fetch hyperparameters")],
+    ):
+        await ApplyWeights.schedule(client, {Hotkey("hotkey1"): Weight(0.5)}, netuid=NetUid(1))
+        tasks = set(ApplyWeights.tasks_running)
+        # The task sleeps before the retry after the failed attempt.
+        await wait_until(lambda: client.calls["get_hyperparams"] == [(1, block)])
+
+        await ApplyWeights.cancel_running()
+
+    assert all(task.cancelled() for task in tasks)
+    assert ApplyWeights.tasks_running == set()
+
+
+@pytest.mark.asyncio
+async def test_apply_weights_cancel_running_waits_for_commit_in_progress():
+    """
+    Test that cancel_running lets weights being committed finish before it returns.
+    """
+    client = MockBittensorClient()
+    block = Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+    committed = []
+
+    async def commit_weights(netuid: NetUid, weights: dict[Hotkey, Weight]) -> RevealRound:
+        client.calls["commit_weights"].append((netuid, weights))
+        await asyncio.sleep(0.1)
+        committed.append(weights)
+        return RevealRound(1)
+
+    client.commit_weights = commit_weights
+    async with client.mock_behavior(
+        get_latest_block=[block, block],
+        get_hyperparams=[SubnetHyperparams(commit_reveal_weights_enabled=CommitReveal.V4)],
+    ):
+        await ApplyWeights.schedule(client, {Hotkey("hotkey1"): Weight(0.5)}, netuid=NetUid(1))
+        tasks = set(ApplyWeights.tasks_running)
+        await wait_until(lambda: client.calls["commit_weights"], sleep_interval=0.01)
+
+        await ApplyWeights.cancel_running()
+
+    assert all(task.cancelled() for task in tasks)
+    assert committed == [{Hotkey("hotkey1"): Weight(0.5)}]
+    assert ApplyWeights.attempts_running == set()
+
+
+@pytest.mark.asyncio
+async def test_apply_weights_cancel_running_cancels_stuck_commit():
+    """
+    Test that cancel_running cancels weights commit that does not finish in time.
+    """
+    client = MockBittensorClient()
+    block = Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+    commit_cancelled = asyncio.Event()
+
+    async def commit_weights(netuid: NetUid, weights: dict[Hotkey, Weight]) -> RevealRound:
+        client.calls["commit_weights"].append((netuid, weights))
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            commit_cancelled.set()
+            raise
+        return RevealRound(1)
+
+    client.commit_weights = commit_weights
+    async with client.mock_behavior(
+        get_latest_block=[block, block],
+        get_hyperparams=[SubnetHyperparams(commit_reveal_weights_enabled=CommitReveal.V4)],
+    ):
+        await ApplyWeights.schedule(client, {Hotkey("hotkey1"): Weight(0.5)}, netuid=NetUid(1))
+        await wait_until(lambda: client.calls["commit_weights"], sleep_interval=0.01)
+
+        await ApplyWeights.cancel_running(attempts_timeout=0.1)
+
+    assert commit_cancelled.is_set()
+    assert ApplyWeights.attempts_running == set()
@@ -0,0 +1,55 @@
+"""
+Tests for the service response classes.
+"""
+
+from litestar.enums import MediaType
+
+from pylon._internal.common.models import Block, SubnetNeurons
+from pylon._internal.common.types import BlockHash, BlockNumber
+from pylon.service.responses import PydanticResponse
+
+
+def test_pydantic_response_reuses_rendered_model():
+    """
+    Test that the JSON of a reusable model is rendered once and reused for the same instance only.
+    """
+    block = Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+    neurons = SubnetNeurons(block=block, neurons={})
+    equal_neurons = SubnetNeurons(block=block, neurons={})
+    response = PydanticResponse(neurons)
+
+    first = response.render(neurons, MediaType.JSON)
+    second = response.render(neurons, MediaType.JSON)
+    other = response.render(equal_neurons, MediaType.JSON)
+
+    assert first == b'{"block":{"number":1000,"hash":"0xabc123"},"neurons":{}}'
+    assert second is first
+    assert other == first
+    assert other is not first
+
+
+def test_pydantic_response_renders_other_models_every_time():
+    """
+    Test that a model which is not reusable is rendered again on every call, so that its modifications are served.
+    """
+    block = Block(number=BlockNumber(1000), hash=BlockHash("0xabc123"))
+    response = PydanticResponse(block)
+
+    first = response.render(block, MediaType.JSON)
+    second = response.render(block, MediaType.JSON)
+    block.number = BlockNumber(1001)
+    modified = response.render(block, MediaType.JSON)
+
+    assert first == b'{"number":1000,"hash":"0xabc123"}'
+    assert second == first
+    assert second is not first
+    assert modified == b'{"number":1001,"hash":"0xabc123"}'
+
+
+def test_pydantic_response_renders_non_json_media_type_the_default_way():
+    """
+    Test that content with a media type other than JSON is rendered by the default response.
+    """
+    response = PydanticResponse("pong", media_type=MediaType.TEXT)
+
+    assert response.render("pong", MediaType.TEXT) == b"pong"